@@ -2,11 +2,14 @@ import vlc
 import time
 import threading
 
+from profiling import Profiler
+
 
 class AudioEngine:
-    def __init__(self, filepath: str, ramp_time=10):
+    def __init__(self, filepath: str, ramp_time=10, profiler=None):
         self.filepath = filepath
         self.RAMP_TIME = ramp_time
+        self.profiler = profiler or Profiler()
 
         # VLC setup
         self.instance = vlc.Instance("--no-video")
@@ -35,12 +38,14 @@ class AudioEngine:
 
     def _start_ramp(self, new_target: int):
         """Trigger new ramp animation."""
-        with self.ramp_lock:
+        with self.profiler.span("audio.ramp_lock"), self.ramp_lock:
             self.target_volume = max(0, min(100, int(new_target)))
             self.is_fading = True
 
         if self.ramp_thread is None or not self.ramp_thread.is_alive():
-            self.ramp_thread = threading.Thread(target=self._ramp_loop, daemon=True)
+            self.ramp_thread = threading.Thread(
+                target=self._ramp_loop, name="audio-ramp", daemon=True
+            )
             self.ramp_thread.start()
 
     def _ramp_loop(self):
@@ -50,7 +55,7 @@ class AudioEngine:
             if not self.running:
                 return
 
-            with self.ramp_lock:
+            with self.profiler.span("audio.ramp_step"), self.ramp_lock:
                 diff = self.target_volume - self.current_volume
                 if abs(diff) < 1:
                     break
@@ -96,7 +101,7 @@ class AudioEngine:
         def finish_pause():
             # Wait until volume reaches 0
             while True:
-                with self.ramp_lock:
+                with self.profiler.span("audio.pause_wait"), self.ramp_lock:
                     if self.current_volume <= 1:   # effectively silent
                         break
                 time.sleep(0.02)
@@ -104,7 +109,7 @@ class AudioEngine:
             # Now safe to pause — no audible click
             self.player.pause()
 
-        threading.Thread(target=finish_pause, daemon=True).start()
+        threading.Thread(target=finish_pause, name="audio-pause", daemon=True).start()
 
 
     def restart(self):
@@ -146,10 +151,11 @@ class AudioEngine:
     def set_rate(self, rate: float):
         rate = max(0.5, min(2.0, rate))
         self.last_rate = rate
-        try:
-            self.player.set_rate(rate)
-        except:
-            pass
+        with self.profiler.span("audio.set_rate"):
+            try:
+                self.player.set_rate(rate)
+            except:
+                pass
 
     # =========================================================
     # STATUS
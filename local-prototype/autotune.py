@@ -0,0 +1,261 @@
+# conductor-vision/frontend/autotune.py
+"""
+Replay labeled recordings through BeatDetector + TempoControl across a
+parameter grid and write the best configuration as a loadable profile.
+
+Labels live in <record_dir>/labels.json:  {"recording_20250101_120000.jsonl": 110}
+
+    python autotune.py                 # full grid
+    python autotune.py --random 200    # random subset of the grid
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from controls.profile import build_controls, save_profile
+
+
+RECORD_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "data", "recordings")
+)
+
+PROFILE_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "data", "profiles", "controls.json")
+)
+
+BEAT_GRID = {
+    "velocity_threshold": [0.15, 0.2, 0.25, 0.35],
+    "min_interval": [0.2, 0.25, 0.3],
+    "alpha": [0.15, 0.25, 0.4],
+}
+
+TEMPO_GRID = {
+    "deadband": [0.001, 0.002, 0.005],
+    "update_interval": [0.1, 0.15, 0.25],
+    "time_constant": [0.2, 0.35, 0.6],
+}
+
+# score = bpm_error (BPM) + latency (sec) * w + rate jitter * w  (lower is better)
+WEIGHTS = {"bpm_error": 1.0, "latency": 2.0, "jitter": 100.0}
+
+CONVERGE_TOLERANCE = 0.05   # within 5% of the labeled BPM
+
+# Cached scores are only valid for the control code that produced them
+CONTROL_SOURCES = ("beat.py", "tempo.py", "profile.py")
+
+
+def _controls_hash():
+    digest = hashlib.sha1()
+    controls_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "controls")
+    for name in CONTROL_SOURCES:
+        with open(os.path.join(controls_dir, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+CONTROLS_HASH = _controls_hash()
+
+
+# ============================================================
+# REPLAY + SCORING
+# ============================================================
+
+@lru_cache(maxsize=32)
+def load_frames(path):
+    """Parsed frames; a truncated line (writer killed mid-take) is dropped."""
+    frames = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                frames.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return tuple(frames)
+
+
+def replay(frames, params):
+    """Feed recorded frames through fresh controls. Returns [(t, bpm, rate)]."""
+    if not frames:
+        return []
+
+    beat, tempo = build_controls(params)
+    t0 = frames[0]["t"]
+    bpm = None
+    trace = []
+
+    for frame in frames:
+        right = frame["hands"].get("Right")
+        if right is not None:
+            bpm = beat.update(right[1], now=frame["t"])
+        rate = tempo.compute_rate(bpm, now=frame["t"])
+        trace.append((frame["t"] - t0, bpm, rate))
+
+    return trace
+
+
+def score(trace, target):
+    duration = trace[-1][0] if trace else 0.0
+    tolerance = CONVERGE_TOLERANCE * target
+
+    # Latency: start of the final run of in-tolerance estimates
+    converged_at = None
+    for t, bpm, _ in trace:
+        if bpm is not None and abs(bpm - target) <= tolerance:
+            if converged_at is None:
+                converged_at = t
+        else:
+            converged_at = None
+
+    errors = [abs(bpm - target) for _, bpm, _ in trace if bpm is not None]
+    rates = [rate for _, _, rate in trace]
+    steps = [b - a for a, b in zip(rates, rates[1:])]
+
+    result = {
+        "bpm_error": statistics.fmean(errors) if errors else float(target),
+        "latency": converged_at if converged_at is not None else duration,
+        "jitter": statistics.pstdev(steps) if len(steps) > 1 else 0.0,
+    }
+    result["score"] = sum(WEIGHTS[k] * result[k] for k in WEIGHTS)
+    return result
+
+
+# ============================================================
+# TRIALS (run in worker processes, cached on disk)
+# ============================================================
+
+def _hash(obj):
+    return hashlib.sha1(json.dumps(obj, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def cache_path(cache_dir, path, target, params):
+    st = os.stat(path)
+    rec_key = _hash([os.path.abspath(path), st.st_size, st.st_mtime_ns])
+    trial_key = _hash([params, target, WEIGHTS, CONVERGE_TOLERANCE, CONTROLS_HASH])
+    return os.path.join(cache_dir, rec_key, f"{trial_key}.json")
+
+
+def run_batch(cache_dir, path, target, batch):
+    """All params in `batch` against one take, so each worker parses it once."""
+    return [run_trial(cache_dir, path, target, params) for params in batch]
+
+
+def run_trial(cache_dir, path, target, params):
+    cached = cache_path(cache_dir, path, target, params)
+    if os.path.exists(cached):
+        with open(cached) as f:
+            return json.load(f)
+
+    result = score(replay(load_frames(path), params), target)
+
+    os.makedirs(os.path.dirname(cached), exist_ok=True)
+    tmp = cached + f".{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(result, f)
+    os.replace(tmp, cached)
+    return result
+
+
+def candidates(n_random=None, seed=0):
+    beat = [dict(zip(BEAT_GRID, v)) for v in itertools.product(*BEAT_GRID.values())]
+    tempo = [dict(zip(TEMPO_GRID, v)) for v in itertools.product(*TEMPO_GRID.values())]
+    grid = [{"beat": b, "tempo": t} for b, t in itertools.product(beat, tempo)]
+
+    if n_random is not None and n_random < len(grid):
+        grid = random.Random(seed).sample(grid, n_random)
+    return grid
+
+
+def tune(takes, grid, cache_dir, workers=None, batch_size=64):
+    """
+    takes = [(path, target_bpm)]
+    Returns [(mean score, params, per-take results)] sorted best first.
+
+    Jobs are grouped per take (one take × `batch_size` configs), so a
+    recording is read once per batch instead of once per trial.
+    """
+    batches = [grid[i:i + batch_size] for i in range(0, len(grid), batch_size)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            [pool.submit(run_batch, cache_dir, path, target, batch) for batch in batches]
+            for path, target in takes
+        ]
+        # per_take[t] = results for every config, in grid order
+        per_take = [
+            [result for f in take_futures for result in f.result()]
+            for take_futures in futures
+        ]
+
+    results = []
+    for i, params in enumerate(grid):
+        trial = [take_results[i] for take_results in per_take]
+        mean = statistics.fmean(r["score"] for r in trial)
+        results.append((mean, params, trial))
+
+    results.sort(key=lambda r: r[0])
+    return results
+
+
+def load_labels(record_dir, labels_path):
+    with open(labels_path) as f:
+        labels = json.load(f)
+
+    takes = []
+    for name, bpm in labels.items():
+        path = os.path.join(record_dir, name)
+        if not name.endswith(".jsonl") or not os.path.exists(path):
+            print(f"[SKIP] {name}: not a .jsonl recording")
+            continue
+        if not load_frames(path):
+            print(f"[SKIP] {name}: no readable frames")
+            continue
+        takes.append((path, float(bpm)))
+    return takes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", default=RECORD_DIR)
+    parser.add_argument("--labels", default=None, help="default: <records>/labels.json")
+    parser.add_argument("--cache", default=None, help="default: <records>/.tuning_cache")
+    parser.add_argument("--out", default=PROFILE_PATH)
+    parser.add_argument("--random", type=int, default=None, help="sample N grid points")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    labels_path = args.labels or os.path.join(args.records, "labels.json")
+    takes = load_labels(args.records, labels_path)
+    if not takes:
+        print("[TUNE] no labeled recordings found")
+        return
+
+    grid = candidates(args.random, args.seed)
+    print(f"[TUNE] {len(grid)} configs × {len(takes)} takes")
+
+    cache_dir = args.cache or os.path.join(args.records, ".tuning_cache")
+    results = tune(takes, grid, cache_dir, args.workers)
+    best_score, best, per_take = results[0]
+
+    print(f"[BEST] score={best_score:.3f} {best}")
+    save_profile(
+        args.out,
+        best["beat"],
+        best["tempo"],
+        score=best_score,
+        takes={os.path.basename(p): r for (p, _), r in zip(takes, per_take)},
+    )
+    print(f"[SAVED] profile → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
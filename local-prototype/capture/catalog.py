@@ -0,0 +1,131 @@
+# conductor-vision/frontend/capture/catalog.py
+
+import sqlite3
+import threading
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS takes (
+    path         TEXT PRIMARY KEY,
+    started_at   REAL,
+    duration     REAL,
+    frame_count  INTEGER,
+    bpm_min      REAL,
+    bpm_max      REAL,
+    left_ratio   REAL,
+    right_ratio  REAL,
+    complete     INTEGER
+);
+CREATE INDEX IF NOT EXISTS takes_bpm ON takes (bpm_min, bpm_max);
+"""
+
+
+class TakeStats:
+    """Running per-take metadata, updated one frame at a time."""
+
+    def __init__(self, path):
+        self.path = path
+        self.started_at = None
+        self.last_time = None
+        self.frame_count = 0
+        self.bpm_min = None
+        self.bpm_max = None
+        self.left_frames = 0
+        self.right_frames = 0
+        self.complete = False
+
+    def add(self, frame):
+        t = frame["t"]
+        if self.started_at is None:
+            self.started_at = t
+        self.last_time = t
+        self.frame_count += 1
+
+        bpm = frame.get("bpm")
+        if bpm is not None:
+            self.bpm_min = bpm if self.bpm_min is None else min(self.bpm_min, bpm)
+            self.bpm_max = bpm if self.bpm_max is None else max(self.bpm_max, bpm)
+
+        hands = frame.get("hands") or {}
+        if "Left" in hands:
+            self.left_frames += 1
+        if "Right" in hands:
+            self.right_frames += 1
+
+    def row(self):
+        n = max(1, self.frame_count)
+        duration = 0.0
+        if self.started_at is not None:
+            duration = self.last_time - self.started_at
+        return (
+            self.path,
+            self.started_at,
+            duration,
+            self.frame_count,
+            self.bpm_min,
+            self.bpm_max,
+            self.left_frames / n,
+            self.right_frames / n,
+            int(self.complete),
+        )
+
+
+class RecordingCatalog:
+    """
+    SQLite index of recorded takes.
+    Lets us query by BPM / hand presence without opening any recording.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def update(self, stats):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO takes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                stats.row(),
+            )
+
+    def find(self, min_bpm=None, max_bpm=None, hand=None, min_presence=0.5,
+             complete_only=True):
+        """
+        Takes whose detected BPM range lies within [min_bpm, max_bpm].
+        hand = "Left" / "Right" → only takes where that hand was present
+        in at least `min_presence` of the frames.
+        """
+        clauses = []
+        params = []
+
+        if min_bpm is not None:
+            clauses.append("bpm_min >= ?")
+            params.append(min_bpm)
+        if max_bpm is not None:
+            clauses.append("bpm_max <= ?")
+            params.append(max_bpm)
+        if hand == "Left":
+            clauses.append("left_ratio >= ?")
+            params.append(min_presence)
+        elif hand == "Right":
+            clauses.append("right_ratio >= ?")
+            params.append(min_presence)
+        elif hand is not None:
+            raise ValueError(f"unknown hand: {hand!r}")
+        if complete_only:
+            clauses.append("complete = 1")
+
+        sql = "SELECT * FROM takes"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY started_at"
+
+        with self.lock:
+            return [dict(r) for r in self.conn.execute(sql, params)]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
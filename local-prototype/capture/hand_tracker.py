@@ -10,29 +10,68 @@ class HandTracker:
     def __init__(self, landmarker):
         self.landmarker = landmarker
 
+    def image(self, rgb):
+        """Wrap an RGB frame for the landmarker."""
+        return mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+
     def detect(self, mp_image, frame):
+        return self.project(self.locate(mp_image), frame)
+
+    def locate(self, mp_image):
+        """
+        Run the landmarker only.
+        Returns {label: [(x, y, z) * 21]} in normalized image coords.
+
+        Crossed / mirrored hands can both come back with the same
+        handedness; the more confident one keeps the label, the other
+        takes the opposite label (or "Hand<idx>") so neither is dropped.
+        """
         result = self.landmarker.detect(mp_image)
-        h, w, _ = frame.shape
-        hands_xy = {}
-        raw_hands = []
+        hands = {}
 
         if not result.hand_landmarks:
-            return hands_xy, raw_hands
+            return hands
+
+        by_score = sorted(
+            range(len(result.hand_landmarks)),
+            key=lambda i: result.handedness[i][0].score,
+            reverse=True,
+        )
+
+        labels = {}
+        for idx in by_score:
+            label = result.handedness[idx][0].category_name
+            other = "Left" if label == "Right" else "Right"
+            if label in labels.values():
+                label = other if other not in labels.values() else f"Hand{idx}"
+            labels[idx] = label
 
+        # Keep MediaPipe's order so raw_hands[0] matches detect()
         for idx, hand in enumerate(result.hand_landmarks):
-            raw = [(lm.x, lm.y, lm.z) for lm in hand]
+            hands[labels[idx]] = [(lm.x, lm.y, lm.z) for lm in hand]
+
+        return hands
+
+    def project(self, hands, frame):
+        """
+        Map located (or predicted) hands onto the frame and draw them.
+        Returns (hands_xy, raw_hands) like detect().
+        """
+        h, w, _ = frame.shape
+        hands_xy = {}
+        raw_hands = []
+
+        for label, raw in hands.items():
             raw_hands.append(raw)
 
             wrist = raw[0]
             px = int(wrist[0] * w)
             py = int(wrist[1] * h)
-
-            label = result.handedness[idx][0].category_name
             hands_xy[label] = (px, py)
 
             lm_list = landmark_pb2.NormalizedLandmarkList()
-            for lm in hand:
-                lm_list.landmark.add(x=lm.x, y=lm.y, z=lm.z)
+            for (x, y, z) in raw:
+                lm_list.landmark.add(x=x, y=y, z=z)
 
             mp_drawing.draw_landmarks(
                 frame,
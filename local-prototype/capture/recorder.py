@@ -2,33 +2,134 @@
 
 import os
 import json
+import queue
+import threading
+import time
 from datetime import datetime
 
 class Recorder:
-    def __init__(self, base_dir):
+    def __init__(self, base_dir, chunk_size=120):
+        """
+        Takes are written as JSON Lines (one frame per line) by a
+        background thread, `chunk_size` frames at a time, and indexed
+        in <base_dir>/catalog.sqlite3 as they grow. Both are only set
+        up on the first take, so sessions that never record pay nothing.
+        """
         self.recording = False
         self.frames = []
         self.out_path = None
         self.base_dir = base_dir
-        os.makedirs(self.base_dir, exist_ok=True)
+        self.chunk_size = chunk_size
+
+        self.catalog = None
+        self.queue = None
+        self.writer = None
 
     def toggle(self):
         self.recording = not self.recording
 
         if self.recording:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            self.out_path = os.path.join(self.base_dir, f"recording_{timestamp}.json")
+            self._start_writer()
+            self.out_path = self._new_path()
             self.frames = []
             print(f"[REC START] → {self.out_path}")
         else:
+            self._flush(final=True)
             print("[REC STOP]")
 
-    def add(self, normalized_frame):
-        if self.recording:
-            self.frames.append(normalized_frame)
+    def add(self, normalized_frame, bpm=None, hands=None, t=None):
+        """
+        normalized_frame = normalized landmarks, or None if no hand
+        bpm              = current BPM estimate
+        hands            = {label: (x, y)} wrist positions, normalized image coords
+        """
+        if not self.recording:
+            return
+
+        self.frames.append({
+            "t": time.time() if t is None else t,
+            "landmarks": normalized_frame,
+            "bpm": bpm,
+            "hands": hands or {},
+        })
+
+        if len(self.frames) >= self.chunk_size:
+            self._flush()
 
     def save(self):
-        if self.frames and self.out_path:
-            with open(self.out_path, "w") as f:
-                json.dump(self.frames, f, indent=2)
-            print(f"[SAVED] {len(self.frames)} frames → {self.out_path}")
+        """Flush the open take and wait for the writer to drain."""
+        if self.recording:
+            self.recording = False
+            self._flush(final=True)
+
+        if self.writer is None:
+            return
+
+        self.queue.put(None)
+        self.writer.join()
+        self.catalog.close()
+
+    # =========================================================
+    # BACKGROUND WRITER
+    # =========================================================
+
+    def _start_writer(self):
+        if self.writer is not None:
+            return
+
+        from capture.catalog import RecordingCatalog
+
+        os.makedirs(self.base_dir, exist_ok=True)
+        self.catalog = RecordingCatalog(os.path.join(self.base_dir, "catalog.sqlite3"))
+
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, name="recorder", daemon=True)
+        self.writer.start()
+
+    def _new_path(self):
+        """Millisecond timestamp, suffixed if a take already claimed it."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        path = os.path.join(self.base_dir, f"recording_{timestamp}.jsonl")
+
+        n = 1
+        while os.path.exists(path) or path == self.out_path:
+            path = os.path.join(self.base_dir, f"recording_{timestamp}_{n}.jsonl")
+            n += 1
+        return path
+
+    def _flush(self, final=False):
+        if self.out_path is None:
+            return
+        self.queue.put((self.out_path, self.frames, final))
+        self.frames = []
+
+    def _write_loop(self):
+        from capture.catalog import TakeStats
+
+        stats = {}
+
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+
+            path, frames, final = item
+            take = stats.setdefault(path, TakeStats(path))
+
+            if frames:
+                # First chunk truncates, so an old file is never extended
+                with open(path, "a" if take.frame_count else "w") as f:
+                    for frame in frames:
+                        f.write(json.dumps(frame, separators=(",", ":")))
+                        f.write("\n")
+                        take.add(frame)
+
+            if final:
+                take.complete = True
+                del stats[path]
+
+            if take.frame_count:
+                self.catalog.update(take)
+
+            if final and take.frame_count:
+                print(f"[SAVED] {take.frame_count} frames → {path}")
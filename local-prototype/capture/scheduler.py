@@ -0,0 +1,117 @@
+# conductor-vision/frontend/capture/scheduler.py
+
+import time
+
+
+class DetectionScheduler:
+    def __init__(
+        self,
+        every_n=2,
+        adaptive=True,
+        max_skip=4,
+        high_energy=1.5,
+        max_extrapolate=0.12
+    ):
+        """
+        every_n         = run inference every Nth frame (fixed mode)
+        adaptive        = derive the interval from motion energy instead
+        max_skip        = longest interval used when the hands are still
+        high_energy     = wrist speed (image widths / sec) that forces
+                          inference on every frame
+        max_extrapolate = seconds past the last inference we keep
+                          extrapolating before holding the last position
+        """
+        self.every_n = max(1, every_n)
+        self.adaptive = adaptive
+        self.max_skip = max(1, max_skip)
+        self.high_energy = high_energy
+        self.max_extrapolate = max_extrapolate
+
+        self.enabled = True
+        self.interval = self.every_n
+        self.frames_since = self.interval   # first frame always detects
+
+        # label → (timestamp, landmarks)
+        self.last = {}
+        # label → per-landmark (vx, vy, vz) in units / sec
+        self.velocity = {}
+        self.energy = 0.0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.frames_since = self.interval
+
+        # Stale history would extrapolate from before the toggle
+        self.last = {}
+        self.velocity = {}
+        self.energy = 0.0
+
+    def due(self):
+        """True if this frame should run full inference."""
+        return not self.enabled or self.frames_since >= self.interval
+
+    def observe(self, hands, now=None):
+        """Feed fresh landmarker output. Returns the hands unchanged."""
+        if now is None:
+            now = time.time()
+
+        velocity = {}
+        speeds = []
+
+        for label, raw in hands.items():
+            prev = self.last.get(label)
+            if prev is not None and now > prev[0]:
+                dt = now - prev[0]
+                vel = [
+                    ((x - px) / dt, (y - py) / dt, (z - pz) / dt)
+                    for (x, y, z), (px, py, pz) in zip(raw, prev[1])
+                ]
+                velocity[label] = vel
+                vx, vy, _ = vel[0]
+                speeds.append((vx * vx + vy * vy) ** 0.5)
+
+        self.last = {label: (now, raw) for label, raw in hands.items()}
+        self.velocity = velocity
+        self.energy = max(speeds) if speeds else 0.0
+
+        self.frames_since = 1
+        self.interval = self._next_interval(hands)
+        return hands
+
+    def predict(self, now=None):
+        """Extrapolate landmarks for a skipped frame."""
+        if now is None:
+            now = time.time()
+
+        self.frames_since += 1
+        hands = {}
+
+        for label, (t, raw) in self.last.items():
+            vel = self.velocity.get(label)
+            if vel is None:
+                hands[label] = raw
+                continue
+
+            dt = min(now - t, self.max_extrapolate)
+            hands[label] = [
+                (x + vx * dt, y + vy * dt, z + vz * dt)
+                for (x, y, z), (vx, vy, vz) in zip(raw, vel)
+            ]
+
+        return hands
+
+    def _next_interval(self, hands):
+        # A hand seen only once has no velocity yet → detect again next frame
+        if any(label not in self.velocity for label in hands):
+            return 1
+
+        if not self.adaptive:
+            return self.every_n
+
+        # Nothing to extrapolate → poll at the fixed rate to pick hands up
+        if not hands:
+            return self.every_n
+
+        # Fast motion → every frame, still hands → max_skip
+        t = min(1.0, self.energy / self.high_energy)
+        return max(1, round(self.max_skip - t * (self.max_skip - 1)))
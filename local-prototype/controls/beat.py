@@ -3,35 +3,51 @@
 import time
 
 class BeatDetector:
-    def __init__(self):
+    def __init__(
+        self,
+        min_interval=0.25,
+        velocity_threshold=0.25,
+        reverse_velocity_limit=-0.375,
+        alpha=0.25
+    ):
         self.last_y = None
+        self.last_time = None
         self.last_downbeat_time = None
         self.ema_bpm = None
 
         # thresholds
-        self.min_interval = 0.25       # sec → max 240 BPM
-        self.velocity_threshold = 4     # minimum downward movement
-        self.reverse_velocity_limit = -6  # upward too fast = reset
+        self.min_interval = min_interval                      # sec → max 240 BPM
+        self.velocity_threshold = velocity_threshold          # min downward speed (heights / sec)
+        self.reverse_velocity_limit = reverse_velocity_limit  # upward too fast = reset
 
         # EMA smoothing
-        self.alpha = 0.25
+        self.alpha = alpha
 
-    def update(self, y):
+    def update(self, y, now=None):
         """
-        Feed right-hand Y pixel coordinate each frame.
+        Feed right-hand Y in normalized image coords (0 = top, 1 = bottom).
+        Velocity is measured per second, so thresholds hold at any
+        resolution or frame rate. `now` lets replays supply recorded timestamps.
         Returns BPM or None.
         """
 
-        now = time.time()
+        if now is None:
+            now = time.time()
 
         # First frame
         if self.last_y is None:
             self.last_y = y
+            self.last_time = now
+            return self.ema_bpm
+
+        dt = now - self.last_time
+        if dt <= 0:
             return self.ema_bpm
 
         # Compute vertical velocity (+ = downward because screen coords)
-        velocity = y - self.last_y
+        velocity = (y - self.last_y) / dt
         self.last_y = y
+        self.last_time = now
 
         # If hand jumps upward violently → reset
         if velocity < self.reverse_velocity_limit:
@@ -0,0 +1,54 @@
+# conductor-vision/frontend/controls/profile.py
+
+import json
+import os
+
+from controls.beat import BeatDetector
+from controls.tempo import TempoControl
+
+# Constructor arguments a profile may override
+BEAT_PARAMS = ("min_interval", "velocity_threshold", "reverse_velocity_limit", "alpha")
+TEMPO_PARAMS = ("deadband", "update_interval", "time_constant")
+
+# Bump when a parameter's units or meaning change.
+# 2: beat velocity in image heights / sec, tempo time_constant in sec
+PROFILE_VERSION = 2
+
+
+def load_profile(path):
+    """
+    Read a tuning profile written by autotune.py.
+    Returns {"beat": {...}, "tempo": {...}}; empty sections (built-in
+    defaults) if the file is missing or from another PROFILE_VERSION.
+    """
+    if not path or not os.path.exists(path):
+        return {"beat": {}, "tempo": {}}
+
+    with open(path) as f:
+        data = json.load(f)
+
+    version = data.get("version")
+    if version != PROFILE_VERSION:
+        print(
+            f"[CONTROLS] ignoring {path}: version {version}, expected {PROFILE_VERSION} "
+            "(re-run autotune.py)"
+        )
+        return {"beat": {}, "tempo": {}}
+
+    return {
+        "beat": {k: v for k, v in data.get("beat", {}).items() if k in BEAT_PARAMS},
+        "tempo": {k: v for k, v in data.get("tempo", {}).items() if k in TEMPO_PARAMS},
+    }
+
+
+def save_profile(path, beat, tempo, **meta):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {**meta, "version": PROFILE_VERSION, "beat": beat, "tempo": tempo}, f, indent=2
+        )
+
+
+def build_controls(profile):
+    """BeatDetector + TempoControl configured from a loaded profile."""
+    return BeatDetector(**profile["beat"]), TempoControl(**profile["tempo"])
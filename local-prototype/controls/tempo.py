@@ -1,5 +1,6 @@
 # conductor-vision/frontend/controls/tempo.py
 
+import math
 import time
 
 class TempoControl:
@@ -9,9 +10,14 @@ class TempoControl:
         max_bpm=160,
         min_rate=0.75,
         max_rate=1.25,
-        deadband=0.002,  
-        update_interval=0.15
+        deadband=0.002,
+        update_interval=0.15,
+        time_constant=0.35
     ):
+        """
+        time_constant = seconds for the rate to cover ~63% of a step
+                        toward the target, independent of call rate
+        """
         self.min_bpm = min_bpm
         self.max_bpm = max_bpm
         self.min_rate = min_rate
@@ -19,12 +25,14 @@ class TempoControl:
 
         self.deadband = deadband
         self.update_interval = update_interval
+        self.time_constant = time_constant
 
         self.last_rate = 1.0
-        self.last_vlc_update_time = 0
+        self.last_vlc_update_time = None
 
-    def compute_rate(self, bpm):
-        now = time.time()
+    def compute_rate(self, bpm, now=None):
+        if now is None:
+            now = time.time()
 
         # keep previous if no BPM
         if bpm is None:
@@ -39,17 +47,22 @@ class TempoControl:
         # map to playback rate
         rate = self.min_rate + t * (self.max_rate - self.min_rate)
 
-        # smooth
-        smoothed = 0.35 * rate + 0.65 * self.last_rate
+        # throttle
+        if self.last_vlc_update_time is None:
+            dt = self.update_interval
+        else:
+            dt = now - self.last_vlc_update_time
+            if dt < self.update_interval:
+                return self.last_rate
+
+        # smooth over elapsed time, not per call
+        alpha = 1.0 - math.exp(-dt / self.time_constant) if self.time_constant > 0 else 1.0
+        smoothed = alpha * rate + (1 - alpha) * self.last_rate
 
         # deadband
         if abs(smoothed - self.last_rate) < self.deadband:
             return self.last_rate
 
-        # throttle
-        if now - self.last_vlc_update_time < self.update_interval:
-            return self.last_rate
-
         # accept new rate
         self.last_vlc_update_time = now
         self.last_rate = smoothed
@@ -1,20 +1,46 @@
 # conductor-vision/frontend/controls/volume.py
 
 import math
+import time
 
 class VolumeControl:
-    def __init__(self, min_dist=40, max_dist=600):
+    def __init__(self, min_dist=0.06, max_dist=0.94, time_constant=0.08):
         """
+        Distances are in image widths, so the mapping is the same at any
+        camera resolution.
         min_dist = hands almost touching (volume = 0)
         max_dist = arms stretched apart (volume = 1)
+        time_constant = output smoothing in seconds (0 = off)
         """
         self.min_dist = min_dist
         self.max_dist = max_dist
+        self.time_constant = time_constant
 
-    def compute(self, lx, ly, rx, ry):
+        self.last_volume = None
+        self.last_time = None
+
+    def compute(self, lx, ly, rx, ry, aspect=16 / 9, now=None):
+        """
+        lx, ly, rx, ry = wrist positions in normalized image coords (0..1)
+        aspect         = frame width / height, to square up the y axis
+        """
         if None in (lx, ly, rx, ry):
+            self.last_volume = None
             return None
 
-        dist = math.sqrt((rx - lx)**2 + (ry - ly)**2)
+        if now is None:
+            now = time.time()
+
+        dist = math.sqrt((rx - lx)**2 + ((ry - ly) / aspect)**2)
         dist = max(self.min_dist, min(self.max_dist, dist))
-        return (dist - self.min_dist) / (self.max_dist - self.min_dist)
+        volume = (dist - self.min_dist) / (self.max_dist - self.min_dist)
+
+        # Exponential smoothing over elapsed time, restarted when a hand drops out
+        if self.last_volume is not None and self.time_constant > 0:
+            dt = max(0.0, now - self.last_time)
+            alpha = 1.0 - math.exp(-dt / self.time_constant)
+            volume = alpha * volume + (1 - alpha) * self.last_volume
+
+        self.last_volume = volume
+        self.last_time = now
+        return volume
@@ -12,7 +12,8 @@ def draw_overlay(frame, info):
         recorder, bpm, volume,
         music_status, playback_rate,
         volume_enabled, tempo_enabled,
-        last_volume_time, volume_timeout
+        last_volume_time, volume_timeout,
+        detect_interval
     """
 
     # Shortcuts
@@ -33,6 +34,7 @@ def draw_overlay(frame, info):
 
     last_volume_time = info["last_volume_time"]
     volume_timeout = info["volume_timeout"]
+    detect_interval = info["detect_interval"]
 
     # ------------------------------------------------------------------
     # TEXT OVERLAY
@@ -105,3 +107,7 @@ def draw_overlay(frame, info):
     else:
         cv2.putText(frame, "ACTIVE", (10, 360),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0,255,100), 2)
+
+    # Inference cadence (1/1 = landmarker every frame)
+    cv2.putText(frame, f"DETECT: 1/{detect_interval}", (10, 390),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200,200,200), 2)
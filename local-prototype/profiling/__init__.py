@@ -0,0 +1,4 @@
+# conductor-vision/frontend/profiling/__init__.py
+
+from .profiler import Profiler
+from .startup import StartupTimer
@@ -0,0 +1,202 @@
+# conductor-vision/frontend/profiling/profiler.py
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class _NullSpan:
+    """Shared no-op context returned while profiling is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    def __init__(
+        self,
+        out_dir=None,
+        enabled=False,
+        max_spans=50000,
+        frame_window=300,
+        p99_budget_ms=None,
+        dump_cooldown=10.0
+    ):
+        """
+        Rolling per-stage span recorder for the vision loop + audio threads.
+
+        max_spans     = spans kept in the ring buffer (oldest dropped)
+        frame_window  = frames used for the rolling p99
+        p99_budget_ms = auto-dump when the rolling p99 frame time exceeds this
+        dump_cooldown = min seconds between automatic dumps
+        """
+        self.out_dir = out_dir
+        self.enabled = enabled
+        self.p99_budget_ms = p99_budget_ms
+        self.dump_cooldown = dump_cooldown
+
+        # (name, thread id, start ns, duration ns); deque.append is thread-safe
+        self.spans = deque(maxlen=max_spans)
+        self.frame_times = deque(maxlen=frame_window)
+        self.thread_names = {}
+
+        self.last_frame_ns = None
+        self.last_dump_time = 0.0
+        self.frames_since_check = 0
+
+        # Trace paths handed out so far + writer threads still running
+        self.dump_paths = set()
+        self.writers = []
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.spans.clear()
+        self.frame_times.clear()
+        self.last_frame_ns = None
+        print(f"[PROFILE] {'ON' if self.enabled else 'OFF'}")
+
+    # =========================================================
+    # RECORDING
+    # =========================================================
+
+    def span(self, name):
+        """`with profiler.span("detect"):` — free when disabled."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name)
+
+    @contextmanager
+    def _span(self, name):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            tid = threading.get_ident()
+            if tid not in self.thread_names:
+                self.thread_names[tid] = threading.current_thread().name
+            self.spans.append((name, tid, start, end - start))
+
+    def frame_done(self):
+        """Mark the end of a main-loop iteration; may trigger a p99 dump."""
+        if not self.enabled:
+            return None
+
+        now_ns = time.perf_counter_ns()
+        if self.last_frame_ns is not None:
+            self.frame_times.append((now_ns - self.last_frame_ns) / 1e6)
+        self.last_frame_ns = now_ns
+
+        if self.p99_budget_ms is None:
+            return None
+
+        # Sorting the window every frame is wasteful; check twice a second-ish
+        self.frames_since_check += 1
+        if self.frames_since_check < 15 or len(self.frame_times) < self.frame_times.maxlen:
+            return None
+        self.frames_since_check = 0
+
+        p99 = self.p99()
+        if p99 > self.p99_budget_ms and time.time() - self.last_dump_time > self.dump_cooldown:
+            return self.dump(reason=f"p99 {p99:.1f}ms > {self.p99_budget_ms:.1f}ms")
+        return None
+
+    def p99(self):
+        if not self.frame_times:
+            return 0.0
+        ordered = sorted(self.frame_times)
+        return ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+
+    # =========================================================
+    # EXPORT
+    # =========================================================
+
+    def to_chrome_trace(self, spans=None, thread_names=None):
+        """
+        Chrome trace-event JSON (also opens in speedscope / Perfetto).
+        Builds from the live buffers unless snapshots are passed in.
+        """
+        if spans is None:
+            spans = list(self.spans)
+        if thread_names is None:
+            thread_names = dict(self.thread_names)
+
+        pid = os.getpid()
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+
+        for name, tid, start, dur in spans:
+            events.append({
+                "name": name,
+                "ph": "X",
+                "pid": pid,
+                "tid": tid,
+                "ts": start / 1000.0,
+                "dur": dur / 1000.0,
+            })
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, reason="manual"):
+        if self.out_dir is None or not self.spans:
+            return None
+
+        os.makedirs(self.out_dir, exist_ok=True)
+        path = self._new_path()
+
+        # Only snapshot here; building events + serializing happen off the
+        # main loop so the dump doesn't cause the stutter it is recording
+        spans = list(self.spans)
+        thread_names = dict(self.thread_names)
+        metadata = {"reason": reason, "p99_ms": self.p99()}
+
+        writer = threading.Thread(
+            target=self._write, args=(path, spans, thread_names, metadata), daemon=True
+        )
+        writer.start()
+        self.writers = [w for w in self.writers if w.is_alive()] + [writer]
+
+        self.last_dump_time = time.time()
+        return path
+
+    def flush(self):
+        """Wait for pending trace writes (e.g. before exit)."""
+        for writer in self.writers:
+            writer.join()
+        self.writers = []
+
+    def _new_path(self):
+        """Millisecond timestamp, suffixed if another dump already claimed it."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        path = os.path.join(self.out_dir, f"trace_{timestamp}.json")
+
+        n = 1
+        while os.path.exists(path) or path in self.dump_paths:
+            path = os.path.join(self.out_dir, f"trace_{timestamp}_{n}.json")
+            n += 1
+
+        self.dump_paths.add(path)
+        return path
+
+    def _write(self, path, spans, thread_names, metadata):
+        trace = self.to_chrome_trace(spans, thread_names)
+        trace["metadata"] = metadata
+
+        # Readers never see a half-written trace
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(trace, f)
+        os.replace(tmp, path)
+        print(f"[PROFILE] {metadata['reason']} → {path}")
@@ -0,0 +1,48 @@
+# conductor-vision/frontend/profiling/startup.py
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """Wall-clock phases from launch to first frame, safe to use from worker threads."""
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.phases = []   # (name, start sec, end sec, thread name)
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter() - self.t0
+        try:
+            yield
+        finally:
+            end = time.perf_counter() - self.t0
+            with self.lock:
+                self.phases.append((name, start, end, threading.current_thread().name))
+
+    def mark(self, name):
+        """Zero-length phase, e.g. "first_frame"."""
+        now = time.perf_counter() - self.t0
+        with self.lock:
+            self.phases.append((name, now, now, threading.current_thread().name))
+
+    def report(self):
+        with self.lock:
+            phases = sorted(self.phases, key=lambda p: p[1])
+
+        lines = ["[STARTUP] phase              start     dur    thread"]
+        for name, start, end, thread in phases:
+            lines.append(
+                f"[STARTUP] {name:<18} {start * 1000:6.0f}ms "
+                f"{(end - start) * 1000:6.0f}ms  {thread}"
+            )
+
+        serial = sum(end - start for name, start, end, _ in phases)
+        total = max((end for _, _, end, _ in phases), default=0.0)
+        lines.append(
+            f"[STARTUP] total {total * 1000:.0f}ms (phases sum to {serial * 1000:.0f}ms serially)"
+        )
+        return "\n".join(lines)
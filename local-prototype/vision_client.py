@@ -1,24 +1,31 @@
 # conductor-vision/frontend/vision_client.py
 
-import cv2
-import mediapipe as mp
-from mediapipe.tasks import python
-from mediapipe.tasks.python import vision
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from capture.normalize import normalize_landmarks
-from capture.buffer import LandmarkBuffer
-from capture.recorder import Recorder
-from capture.hand_tracker import HandTracker
+from profiling import Profiler, StartupTimer
 
-from controls.beat import BeatDetector
-from controls.volume import VolumeControl
-from controls.tempo import TempoControl
+# Started before any heavy import so the report covers launch → first frame
+STARTUP = StartupTimer()
 
-from audio.audio_engine import AudioEngine
-from overlay.overlay import draw_overlay
+with STARTUP.phase("import cv2"):
+    import cv2
 
+# mediapipe (via capture.hand_tracker) and vlc (via audio) are imported on
+# the startup loader threads below; the recording catalog on the first take
+with STARTUP.phase("import modules"):
+    from capture.normalize import normalize_landmarks
+    from capture.buffer import LandmarkBuffer
+    from capture.recorder import Recorder
+    from capture.scheduler import DetectionScheduler
+
+    from controls.beat import BeatDetector
+    from controls.volume import VolumeControl
+    from controls.tempo import TempoControl
+    from controls.profile import load_profile
+
+    from overlay.overlay import draw_overlay
 
 
 MODEL_PATH = os.path.abspath(
@@ -33,17 +40,85 @@ MUSIC_PATH = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "data", "music", "music.mp3")
 )
 
+PROFILE_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "data", "profiles", "controls.json")
+)
+
+TRACE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "data", "traces")
+)
+
+
+def load_tracker(startup):
+    """Import mediapipe and load hand_landmarker.task (worker thread)."""
+    with startup.phase("import mediapipe"):
+        from mediapipe.tasks import python
+        from mediapipe.tasks.python import vision
+        from capture.hand_tracker import HandTracker
+
+    with startup.phase("load model"):
+        base_options = python.BaseOptions(model_asset_path=MODEL_PATH)
+
+        options = vision.HandLandmarkerOptions(
+            base_options=base_options,
+            num_hands=2,
+            min_hand_detection_confidence=0.5,
+            min_hand_presence_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+
+        landmarker = vision.HandLandmarker.create_from_options(options)
+
+    return HandTracker(landmarker)
+
+
+def open_audio(startup, profiler):
+    """Import vlc and open the track (worker thread)."""
+    with startup.phase("init audio"):
+        from audio.audio_engine import AudioEngine
+        return AudioEngine(MUSIC_PATH, profiler=profiler)
+
 
 def main():
 
-    cv2.namedWindow("Conductor Vision", cv2.WINDOW_NORMAL)
-    cv2.resizeWindow("Conductor Vision", 1280, 720)
+    startup = STARTUP
+
+    VOLUME_TIMEOUT = 2.0   # seconds of no volume input → pause
+    FRAME_P99_BUDGET_MS = 50.0   # profiling: auto-dump a trace above this
+
+    # ---------------------------------------------------------
+    # Profiler (off unless CONDUCTOR_PROFILE=1 or toggled with P)
+    # ---------------------------------------------------------
+    profiler = Profiler(
+        TRACE_DIR,
+        enabled=os.environ.get("CONDUCTOR_PROFILE") == "1",
+        p99_budget_ms=FRAME_P99_BUDGET_MS,
+    )
+
+    # ---------------------------------------------------------
+    # Model + audio load on workers while the main thread opens
+    # the window and camera
+    # ---------------------------------------------------------
+    loader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="startup")
+    tracker_future = loader.submit(load_tracker, startup)
+    audio_future = loader.submit(open_audio, startup, profiler)
+
+    # GUI + camera stay on the main thread: macOS AVFoundation asks for
+    # camera permission on the main run loop and fails from a worker
+    with startup.phase("open camera"):
+        cap = cv2.VideoCapture(0)
+
+    with startup.phase("window"):
+        cv2.namedWindow("Conductor Vision", cv2.WINDOW_NORMAL)
+        cv2.resizeWindow("Conductor Vision", 1280, 720)
 
 
     last_volume_time = time.time()
-    tempo_control = TempoControl()
 
-    VOLUME_TIMEOUT = 2.0   # seconds of no volume input → pause
+    # Tuned thresholds (autotune.py) if present, else built-in defaults
+    with startup.phase("controls"):
+        profile = load_profile(PROFILE_PATH)
+        tempo_control = TempoControl(**profile["tempo"])
 
     # ---------------------------------------------------------
     # DEBUG FLAGS + DEFAULTS
@@ -57,37 +132,24 @@ def main():
     # ---------------------------------------------------------
     # Control logic
     # ---------------------------------------------------------
-    beat_detector = BeatDetector()
+    beat_detector = BeatDetector(**profile["beat"])
     volume_control = VolumeControl()
 
-    # ---------------------------------------------------------
-    # Audio engine
-    # ---------------------------------------------------------
-    audio = AudioEngine(MUSIC_PATH)
-
-    # ---------------------------------------------------------
-    # MediaPipe
-    # ---------------------------------------------------------
-    base_options = python.BaseOptions(model_asset_path=MODEL_PATH)
-
-    options = vision.HandLandmarkerOptions(
-        base_options=base_options,
-        num_hands=2,
-        min_hand_detection_confidence=0.5,
-        min_hand_presence_confidence=0.5,
-        min_tracking_confidence=0.5
-    )
-
-    landmarker = vision.HandLandmarker.create_from_options(options)
-    tracker = HandTracker(landmarker)
+    scheduler = DetectionScheduler(every_n=2, adaptive=True)
 
     buffer = LandmarkBuffer(max_seconds=2.0)
     recorder = Recorder(RECORD_DIR)
 
-    cap = cv2.VideoCapture(0)
+    # ---------------------------------------------------------
+    # Join the loaders (re-raises any startup failure here)
+    # ---------------------------------------------------------
+    tracker = tracker_future.result()
+    audio = audio_future.result()
+    loader.shutdown()
 
     prev_time = time.time()
     fps = 0
+    shown = False
 
     bpm = None
     volume = None
@@ -99,7 +161,14 @@ def main():
     # ============================================================
     while True:
 
-        key = cv2.waitKey(1) & 0xFF
+        with profiler.span("waitKey"):
+            key = cv2.waitKey(1) & 0xFF
+
+        # First frame counts once waitKey has pumped the window and painted it
+        if startup is not None and shown:
+            startup.mark("first frame painted")
+            print(startup.report())
+            startup = None
 
         # Toggle recording
         if key == ord("r"):
@@ -130,6 +199,17 @@ def main():
             # On toggle → restore default rate
             audio.set_rate(DEFAULT_RATE)
 
+        # D → toggle detection skipping (full inference every frame)
+        if key == ord("d"):
+            scheduler.toggle()
+
+        # P → toggle profiling, O → dump the current trace window
+        if key == ord("p"):
+            profiler.toggle()
+
+        if key == ord("o"):
+            profiler.dump(reason="hotkey")
+
         # Quit
         if key == ord("q"):
             break
@@ -137,81 +217,112 @@ def main():
         # ---------------------------------------------------------
         # Camera + Hand Tracking
         # ---------------------------------------------------------
-        ret, frame = cap.read()
+        with profiler.span("camera.read"):
+            ret, frame = cap.read()
         if not ret:
             break
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+        # One capture timestamp drives every time-based control this frame
+        frame_time = time.time()
+        h, w, _ = frame.shape
 
-        hands_xy, raw_hands = tracker.detect(mp_image, frame)
+        # Full inference on scheduled frames, extrapolate in between
+        if scheduler.due():
+            with profiler.span("detect"):
+                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                hands = scheduler.observe(tracker.locate(tracker.image(rgb)), now=frame_time)
+        else:
+            with profiler.span("predict"):
+                hands = scheduler.predict(now=frame_time)
+
+        with profiler.span("project"):
+            hands_xy, raw_hands = tracker.project(hands, frame)
 
         left_px, left_py = hands_xy.get("Left", (None, None))
         right_px, right_py = hands_xy.get("Right", (None, None))
 
-        # Normalize + record
+        # Resolution-independent wrist positions for the controls
+        wrists = {label: raw[0][:2] for label, raw in hands.items()}
+        left_x, left_y = wrists.get("Left", (None, None))
+        right_x, right_y = wrists.get("Right", (None, None))
+
+        # Normalize
+        normalized = None
         if raw_hands:
             normalized = normalize_landmarks(raw_hands[0])
             buffer.add(normalized)
-            recorder.add(normalized)
 
         bufsize = len(buffer.get_sequence())
 
         # ---------------------------------------------------------
         # BEAT DETECTION → BPM
         # ---------------------------------------------------------
-        if right_py is not None:
-            bpm = beat_detector.update(right_py)
-
-        # ---------------------------------------------------------
-        # TEMPO CONTROL
-        # ---------------------------------------------------------
-        playback_rate = tempo_control.compute_rate(bpm)
-
-        if tempo_enabled:
-            audio.set_rate(playback_rate)
-        else:
-            audio.set_rate(DEFAULT_RATE)
-
-        # ---------------------------------------------------------
-        # VOLUME CONTROL
-        # ---------------------------------------------------------
-        volume = volume_control.compute(left_px, left_py, right_px, right_py)
-
-        if volume_enabled and volume is not None:
-            audio.set_expressive_volume(volume)
-            last_volume_time = time.time()
-
-            if not audio.is_playing():
-                audio.play()
-
-        elif volume_enabled:
-            # If no input for too long → auto pause
-            if time.time() - last_volume_time > VOLUME_TIMEOUT:
-                if audio.is_playing():
-                    audio.pause()
-        else:
-            # Volume control OFF → enforce default baseline
-            audio.set_expressive_volume(DEFAULT_VOLUME)
+        if right_y is not None:
+            bpm = beat_detector.update(right_y, now=frame_time)
+
+        # Record (written + cataloged on the recorder's background thread)
+        with profiler.span("record"):
+            recorder.add(
+                normalized,
+                bpm=bpm,
+                hands=wrists,
+                t=frame_time,
+            )
+
+        with profiler.span("controls"):
+            # ---------------------------------------------------------
+            # TEMPO CONTROL
+            # ---------------------------------------------------------
+            playback_rate = tempo_control.compute_rate(bpm, now=frame_time)
+
+            if tempo_enabled:
+                audio.set_rate(playback_rate)
+            else:
+                audio.set_rate(DEFAULT_RATE)
+
+            # ---------------------------------------------------------
+            # VOLUME CONTROL
+            # ---------------------------------------------------------
+            volume = volume_control.compute(
+                left_x, left_y, right_x, right_y, aspect=w / h, now=frame_time
+            )
+
+            if volume_enabled and volume is not None:
+                audio.set_expressive_volume(volume)
+                last_volume_time = frame_time
+
+                if not audio.is_playing():
+                    audio.play()
+
+            elif volume_enabled:
+                # If no input for too long → auto pause
+                if frame_time - last_volume_time > VOLUME_TIMEOUT:
+                    if audio.is_playing():
+                        audio.pause()
+            else:
+                # Volume control OFF → enforce default baseline
+                audio.set_expressive_volume(DEFAULT_VOLUME)
 
        # ====================================================
        # OVERLAY (refactored)
        # ====================================================
-        draw_overlay(frame, {
-            "fps": fps,
-            "bufsize": bufsize,
-            "left_px": left_px, "left_py": left_py,
-            "right_px": right_px, "right_py": right_py,
-            "recorder": recorder,
-            "bpm": bpm,
-            "volume": volume,
-            "music_status": "PLAYING" if audio.is_playing() else "PAUSED",
-            "rate": playback_rate,
-            "volume_enabled": volume_enabled,
-            "tempo_enabled": tempo_enabled,
-            "last_volume_time": last_volume_time,
-            "volume_timeout": VOLUME_TIMEOUT,
-        })
+        with profiler.span("overlay"):
+            draw_overlay(frame, {
+                "fps": fps,
+                "bufsize": bufsize,
+                "left_px": left_px, "left_py": left_py,
+                "right_px": right_px, "right_py": right_py,
+                "recorder": recorder,
+                "bpm": bpm,
+                "volume": volume,
+                "music_status": "PLAYING" if audio.is_playing() else "PAUSED",
+                "rate": playback_rate,
+                "volume_enabled": volume_enabled,
+                "tempo_enabled": tempo_enabled,
+                "last_volume_time": last_volume_time,
+                "volume_timeout": VOLUME_TIMEOUT,
+                "detect_interval": scheduler.interval if scheduler.enabled else 1,
+            })
 
 
         # FPS update
@@ -219,10 +330,15 @@ def main():
         fps = 1.0 / (now - prev_time)
         prev_time = now
 
-        cv2.imshow("Conductor Vision", frame)
+        with profiler.span("imshow"):
+            cv2.imshow("Conductor Vision", frame)
+
+        profiler.frame_done()
+        shown = True
 
     cap.release()
     recorder.save()
+    profiler.flush()
     cv2.destroyAllWindows()
 
 
@@ -0,0 +1,11 @@
+"""
+Shared pytest setup: the prototype modules live in local-prototype/ and
+import each other as top-level packages (capture, controls, ...).
+"""
+
+import os
+import sys
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "local-prototype"))
+)
@@ -0,0 +1,73 @@
+"""Autotuner scoring, cache keys and batched replay."""
+
+import json
+import math
+
+import pytest
+
+import autotune
+
+
+def test_score_latency_is_start_of_final_in_tolerance_run():
+    # In tolerance at 1.0, drifts out at 2.0, back in from 3.0 onwards
+    trace = [
+        (0.0, None, 1.0),
+        (1.0, 100.0, 1.0),
+        (2.0, 120.0, 1.0),
+        (3.0, 101.0, 1.0),
+        (4.0, 99.0, 1.0),
+    ]
+    result = autotune.score(trace, 100.0)
+
+    assert result["latency"] == 3.0
+    assert result["bpm_error"] == pytest.approx((0 + 20 + 1 + 1) / 4)
+    assert result["jitter"] == 0.0
+
+
+def test_score_never_converged_falls_back_to_duration_and_target():
+    trace = [(0.0, None, 1.0), (2.5, None, 1.0)]
+    result = autotune.score(trace, 110.0)
+
+    assert result["latency"] == 2.5
+    assert result["bpm_error"] == 110.0
+
+
+def test_score_jitter_is_spread_of_rate_steps():
+    steady = [(i * 0.1, 100.0, 1.0 + 0.01 * i) for i in range(10)]
+    wobbly = [(i * 0.1, 100.0, 1.0 + (0.02 if i % 2 else 0.0)) for i in range(10)]
+
+    assert autotune.score(steady, 100.0)["jitter"] == pytest.approx(0.0, abs=1e-12)
+    assert autotune.score(wobbly, 100.0)["jitter"] > 0.01
+
+
+def test_cache_path_tracks_params_and_control_code(tmp_path, monkeypatch):
+    take = tmp_path / "take.jsonl"
+    take.write_text('{"t": 0, "hands": {}}\n')
+    params = {"beat": {"alpha": 0.25}, "tempo": {"time_constant": 0.35}}
+    other = {"beat": {"alpha": 0.4}, "tempo": {"time_constant": 0.35}}
+
+    base = autotune.cache_path(str(tmp_path), str(take), 110.0, params)
+    assert base == autotune.cache_path(str(tmp_path), str(take), 110.0, params)
+    assert base != autotune.cache_path(str(tmp_path), str(take), 110.0, other)
+
+    monkeypatch.setattr(autotune, "CONTROLS_HASH", "edited-controls")
+    assert base != autotune.cache_path(str(tmp_path), str(take), 110.0, params)
+
+
+def test_tune_batches_keep_grid_order(tmp_path):
+    take = tmp_path / "take.jsonl"
+    with open(take, "w") as f:
+        for i in range(300):
+            t = i / 30
+            y = 0.5 + 0.15 * math.sin(2 * math.pi * t * 110 / 60)
+            f.write(json.dumps({"t": t, "hands": {"Right": [0.5, y]}}) + "\n")
+
+    grid = autotune.candidates(5, seed=1)
+    takes = [(str(take), 110.0)]
+    cache_dir = str(tmp_path / "cache")
+
+    batched = autotune.tune(takes, grid, cache_dir, workers=2, batch_size=2)
+    for mean, params, per_take in batched:
+        expected = autotune.run_trial(cache_dir, str(take), 110.0, params)
+        assert per_take == [expected]
+        assert mean == expected["score"]
@@ -0,0 +1,69 @@
+"""Tempo / volume / beat controls behave the same at any frame rate or resolution."""
+
+import pytest
+
+from controls.beat import BeatDetector
+from controls.tempo import TempoControl
+from controls.volume import VolumeControl
+
+
+def run_tempo(fps, seconds=1.0, bpm=150, **kwargs):
+    tempo = TempoControl(**kwargs)
+    rate = tempo.last_rate
+    for i in range(int(seconds * fps) + 1):
+        rate = tempo.compute_rate(bpm, now=i / fps)
+    return rate
+
+
+def test_tempo_smoothing_matches_across_frame_rates():
+    assert run_tempo(20) == pytest.approx(run_tempo(60), abs=0.005)
+
+
+def test_tempo_time_constant_is_exact_without_throttle():
+    kwargs = {"update_interval": 0.0, "deadband": 0.0}
+    assert run_tempo(20, **kwargs) == pytest.approx(run_tempo(60, **kwargs), abs=1e-9)
+
+
+def test_volume_same_pose_across_aspect_ratios():
+    # Hands 0.5 frame widths apart horizontally, 0.2 widths vertically
+    def pose(aspect):
+        return (0.25, 0.5, 0.75, 0.5 + 0.2 * aspect)
+
+    wide = VolumeControl(time_constant=0).compute(*pose(16 / 9), aspect=16 / 9, now=0.0)
+    square = VolumeControl(time_constant=0).compute(*pose(4 / 3), aspect=4 / 3, now=0.0)
+    assert wide == pytest.approx(square)
+
+
+def test_volume_same_pose_across_resolutions():
+    def volume(w, h):
+        lx, ly, rx, ry = 0.3 * w, 0.4 * h, 0.8 * w, 0.6 * h   # same pose in pixels
+        return VolumeControl(time_constant=0).compute(
+            lx / w, ly / h, rx / w, ry / h, aspect=w / h, now=0.0
+        )
+
+    assert volume(1280, 720) == pytest.approx(volume(1920, 1080))
+
+
+def test_volume_smoothing_matches_across_frame_rates():
+    def run(fps):
+        volume = VolumeControl(time_constant=0.08)
+        volume.compute(0.45, 0.5, 0.55, 0.5, now=0.0)
+        out = None
+        for i in range(1, int(0.1 * fps) + 1):
+            out = volume.compute(0.1, 0.5, 0.9, 0.5, now=i / fps)
+        return out
+
+    assert run(20) == pytest.approx(run(60), abs=1e-9)
+
+
+@pytest.mark.parametrize("fps", [20, 30, 60])
+def test_beat_velocity_is_per_second(fps):
+    def downbeat_seen(speed):
+        beat = BeatDetector(velocity_threshold=0.3)
+        for i in range(fps // 4):
+            beat.update(0.3 + speed * i / fps, now=i / fps)
+        return beat.last_downbeat_time is not None
+
+    # Same threshold in heights / sec fires (or not) regardless of dt
+    assert downbeat_seen(0.4)
+    assert not downbeat_seen(0.2)
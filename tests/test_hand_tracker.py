@@ -0,0 +1,42 @@
+"""HandTracker.locate handedness handling (needs mediapipe)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("mediapipe")
+
+from capture.hand_tracker import HandTracker  # noqa: E402
+
+
+class FakeLandmarker:
+    def __init__(self, hands):
+        # hands = [(category_name, score, wrist_x)]
+        self.result = SimpleNamespace(
+            hand_landmarks=[
+                [SimpleNamespace(x=x, y=0.5, z=0.0)] * 21 for _, _, x in hands
+            ],
+            handedness=[
+                [SimpleNamespace(category_name=name, score=score)] for name, score, _ in hands
+            ],
+        )
+
+    def detect(self, mp_image):
+        return self.result
+
+
+def test_duplicate_handedness_keeps_both_hands():
+    tracker = HandTracker(FakeLandmarker([("Right", 0.6, 0.2), ("Right", 0.9, 0.8)]))
+    hands = tracker.locate(None)
+
+    assert set(hands) == {"Left", "Right"}
+    assert hands["Right"][0][0] == 0.8   # more confident hand keeps its label
+    assert hands["Left"][0][0] == 0.2
+    assert list(hands) == ["Left", "Right"]   # MediaPipe order preserved
+
+
+def test_distinct_handedness_unchanged():
+    tracker = HandTracker(FakeLandmarker([("Left", 0.9, 0.2), ("Right", 0.9, 0.8)]))
+    hands = tracker.locate(None)
+    assert hands["Left"][0][0] == 0.2
+    assert hands["Right"][0][0] == 0.8
@@ -0,0 +1,46 @@
+"""Span profiler: disabled cost path and trace dumps."""
+
+import json
+import os
+import threading
+
+from profiling import Profiler
+
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    profiler = Profiler(str(tmp_path))
+    with profiler.span("detect"):
+        pass
+    assert not profiler.spans
+    assert profiler.dump() is None
+
+
+def test_rapid_dumps_get_unique_complete_files(tmp_path):
+    profiler = Profiler(str(tmp_path), enabled=True)
+    stop = threading.Event()
+
+    def audio_thread():
+        while not stop.is_set():
+            with profiler.span("audio.ramp_step"):
+                pass
+
+    worker = threading.Thread(target=audio_thread, name="audio-ramp")
+    worker.start()
+    try:
+        for _ in range(200):
+            with profiler.span("detect"):
+                pass
+        paths = [profiler.dump(reason="hotkey") for _ in range(3)]
+    finally:
+        stop.set()
+        worker.join()
+    profiler.flush()
+
+    assert len(set(paths)) == 3
+    for path in paths:
+        with open(path) as f:
+            trace = json.load(f)
+        assert trace["metadata"]["reason"] == "hotkey"
+        names = {e["name"] for e in trace["traceEvents"] if e["ph"] == "X"}
+        assert "detect" in names
+    assert not [p for p in os.listdir(str(tmp_path)) if p.endswith(".tmp")]
@@ -0,0 +1,62 @@
+"""Background recording writer + SQLite take catalog."""
+
+import os
+
+from capture.catalog import RecordingCatalog
+from capture.recorder import Recorder
+
+
+def record_take(recorder, bpms, t0):
+    recorder.toggle()
+    for i, bpm in enumerate(bpms):
+        recorder.add(None, bpm=bpm, hands={"Right": (0.5, 0.5)}, t=t0 + i * 0.1)
+    recorder.toggle()
+
+
+def count_lines(path):
+    with open(path) as f:
+        return sum(1 for line in f if line.strip())
+
+
+def test_back_to_back_takes_get_their_own_files(tmp_path):
+    recorder = Recorder(str(tmp_path), chunk_size=2)
+
+    record_take(recorder, [100, 102, 104, 106, 108], t0=1000.0)
+    first = recorder.out_path
+    record_take(recorder, [130, 131], t0=2000.0)
+    second = recorder.out_path
+    recorder.save()
+
+    assert first != second
+    assert count_lines(first) == 5
+    assert count_lines(second) == 2
+
+    catalog = RecordingCatalog(os.path.join(str(tmp_path), "catalog.sqlite3"))
+    rows = {row["path"]: row for row in catalog.find()}
+    assert rows[first]["frame_count"] == 5
+    assert rows[first]["started_at"] == 1000.0
+    assert rows[second]["frame_count"] == 2
+    catalog.close()
+
+
+def test_catalog_bpm_query(tmp_path):
+    recorder = Recorder(str(tmp_path), chunk_size=3)
+    record_take(recorder, [100, 110, 118], t0=0.0)
+    slow = recorder.out_path
+    record_take(recorder, [90, 125], t0=10.0)
+    recorder.save()
+
+    catalog = RecordingCatalog(os.path.join(str(tmp_path), "catalog.sqlite3"))
+    found = catalog.find(min_bpm=100, max_bpm=120)
+    assert [row["path"] for row in found] == [slow]
+    assert found[0]["bpm_min"] == 100
+    assert found[0]["bpm_max"] == 118
+    assert found[0]["right_ratio"] == 1.0
+    assert catalog.find(min_bpm=100, max_bpm=120, hand="Left") == []
+    catalog.close()
+
+
+def test_save_without_recording_creates_nothing(tmp_path):
+    base = os.path.join(str(tmp_path), "recordings")
+    Recorder(base).save()
+    assert not os.path.exists(base)
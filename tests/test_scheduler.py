@@ -0,0 +1,64 @@
+"""Detection scheduler cadence + landmark extrapolation."""
+
+import pytest
+
+from capture.scheduler import DetectionScheduler
+
+
+def hand(x, y):
+    return {"Right": [(x, y, 0.0)] * 21}
+
+
+def run_cadence(scheduler, frames, dt=1 / 30):
+    """Drive the scheduler like the main loop; returns "D"/"P" per frame."""
+    cadence = []
+    for i in range(frames):
+        now = i * dt
+        if scheduler.due():
+            scheduler.observe(hand(0.5, 0.5), now=now)
+            cadence.append("D")
+        else:
+            scheduler.predict(now=now)
+            cadence.append("P")
+    return cadence
+
+
+def test_new_hand_is_detected_again_before_skipping():
+    scheduler = DetectionScheduler(every_n=2, adaptive=True, max_skip=4)
+    cadence = run_cadence(scheduler, 7)
+
+    # Second observation comes straight away, only then the still hand is skipped
+    assert cadence[:2] == ["D", "D"]
+    assert cadence[2:] == ["P", "P", "P", "D", "P"]
+
+
+def test_toggle_resets_history():
+    scheduler = DetectionScheduler(every_n=2, adaptive=True, max_skip=4)
+    run_cadence(scheduler, 5)
+
+    scheduler.toggle()
+    scheduler.toggle()
+    assert scheduler.due()
+    scheduler.observe(hand(0.5, 0.5), now=1.0)
+    assert scheduler.interval == 1
+
+
+def test_predict_extrapolates_from_velocity():
+    scheduler = DetectionScheduler(max_extrapolate=0.12)
+    scheduler.observe(hand(0.50, 0.5), now=0.0)
+    scheduler.observe(hand(0.52, 0.5), now=0.04)   # 0.5 widths / sec
+
+    x, y, _ = scheduler.predict(now=0.08)["Right"][0]
+    assert x == pytest.approx(0.54)
+    assert y == pytest.approx(0.5)
+
+    # Horizon is capped so a lost hand doesn't drift off screen
+    x, _, _ = scheduler.predict(now=1.0)["Right"][0]
+    assert x == pytest.approx(0.52 + 0.5 * 0.12)
+
+
+def test_fast_motion_detects_every_frame():
+    scheduler = DetectionScheduler(adaptive=True, high_energy=1.5)
+    scheduler.observe(hand(0.2, 0.5), now=0.0)
+    scheduler.observe(hand(0.3, 0.5), now=1 / 30)   # 3 widths / sec
+    assert scheduler.interval == 1